@@ -8,9 +8,10 @@ Author: Lin I-Ping
 
 import time
 import json
-import xml.etree.ElementTree as ET
-import statistics
-import matplotlib.pyplot as plt
+import random
+import types
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import numpy as np
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
@@ -25,6 +26,7 @@ class ProtocolMetrics:
         """
         Latency = Network_Delay + Processing_Time + Serialization_Time
         Serialization_Time = Message_Size / Bandwidth_Coefficient
+        Accepts scalars or NumPy arrays (evaluated element-wise)
         """
         serialization_time = message_size / 1000  # Simplified model
         return network_delay + processing_time + serialization_time
@@ -32,20 +34,66 @@ class ProtocolMetrics:
     @staticmethod
     def security_score(encryption: bool, authentication: bool, authorization: bool) -> float:
         """Security scoring model based on CIA triad implementation"""
-        base_score = 0.0
-        if encryption:
-            base_score += 0.4  # Confidentiality
-        if authentication:
-            base_score += 0.3  # Integrity
-        if authorization:
-            base_score += 0.3  # Availability/Authorization
-        return base_score
+        return (0.4 * encryption  # Confidentiality
+                + 0.3 * authentication  # Integrity
+                + 0.3 * authorization)  # Availability/Authorization
     
     @staticmethod
     def complexity_metric(operations: int, data_structures: int, syntax_elements: int) -> float:
         """Complexity measurement using weighted factors"""
         return (operations * 0.4) + (data_structures * 0.3) + (syntax_elements * 0.3)
 
+def _json_size(obj: any, _n=len) -> int:
+    """Length of json.dumps(obj).encode() computed without building the string"""
+    if isinstance(obj, str):
+        if obj.isascii() and obj.isprintable() and '"' not in obj and '\\' not in obj:
+            return _n(obj) + 2  # Quoted, nothing to escape
+        return _n(json.dumps(obj))
+    if obj is None or obj is True:
+        return 4
+    if obj is False:
+        return 5
+    if isinstance(obj, int):
+        return _n(str(obj))
+    if isinstance(obj, dict):
+        # Braces, ": " after each key and ", " between items
+        size = 4 * _n(obj) or 2
+        for key, value in obj.items():
+            if not isinstance(key, str):
+                return _n(json.dumps(obj).encode())
+            size += _json_size(key) + _json_size(value)
+        return size
+    if isinstance(obj, (list, tuple)):
+        # Brackets and ", " between items
+        return (2 * _n(obj) or 2) + sum(map(_json_size, obj))
+    return _n(json.dumps(obj).encode())
+
+# Encoded length of '{"name": "", "value": }', i.e. one variable binding
+# without its OID and value
+_VARBIND_OVERHEAD = _json_size({"name": "", "value": None}) - len("null")
+
+# Protobuf (proto3) wire-format sizing of the same SNMP message; field numbers
+# are all below 16, so every tag is a single byte:
+#   message SNMPMessage { string version = 1; int32 msg_id = 2; int32 msg_max_size = 3;
+#                         string msg_flags = 4; int32 msg_security_model = 5; PDU pdu = 6; }
+#   message PDU { int32 request_id = 1; int32 error_status = 2; int32 error_index = 3;
+#                 int32 non_repeaters = 4; int32 max_repetitions = 5;
+#                 repeated VarBind variable_bindings = 6; }
+#   message VarBind { string name = 1; string value = 2; }
+def _varint_size(n: int) -> int:
+    """Bytes needed to encode a varint; negative int32 values are sign-extended to 10 bytes"""
+    if n < 0:
+        return 10
+    return (n.bit_length() + 6) // 7 or 1
+
+def _pb_int_size(n: int) -> int:
+    """Tag plus varint; zero is the proto3 default and is not encoded"""
+    return 1 + _varint_size(n) if n else 0
+
+def _pb_bytes_size(length: int) -> int:
+    """Tag plus length prefix plus payload; empty is the proto3 default"""
+    return 1 + _varint_size(length) + length if length else 0
+
 class MessageType(Enum):
     """Message types for protocol comparison"""
     GET = "get"
@@ -53,79 +101,160 @@ class MessageType(Enum):
     NOTIFICATION = "notification"
     BULK = "bulk"
 
-@dataclass
-class ProtocolMessage:
-    """Generic protocol message structure"""
-    protocol: str
-    message_type: MessageType
-    payload_size: int
-    timestamp: float
-    security_enabled: bool
+# Sample MIB objects (RFC 1213), shared read-only by every simulator
+_MIB_DEFAULTS = types.MappingProxyType({
+    "1.3.6.1.2.1.1.1.0": "System Description",
+    "1.3.6.1.2.1.1.3.0": "System Uptime",
+    "1.3.6.1.2.1.2.1.0": "Interface Number",
+    "1.3.6.1.2.1.2.2.1.2": "Interface Description"
+})
 
 class SNMPSimulator:
-    """SNMP Protocol Simulator based on RFC 1157, 3411-3418"""
+    """
+    SNMP Protocol Simulator based on RFC 1157, 3411-3418
+    processing_time covers building a request, not computing its payload_size;
+    with build_message=False nothing is built, so it is not comparable to NETCONF
+    """
     
-    def __init__(self):
+    def __init__(self, encoding: str = "json"):
+        if encoding not in ("json", "protobuf"):
+            raise ValueError(f"Unsupported encoding: {encoding}")
         self.version = "3"  # SNMPv3 for security features
         self.community = "public"
         self.security_model = 3  # User-based Security Model (USM)
+        self.encoding = encoding  # Wire encoding used for payload_size
         self.mib_objects = self._initialize_mib()
+        
+        # Encoded size of the fixed envelope with zero-valued IDs and no bindings;
+        # per-call sizes only add the digits of the IDs and the variable bindings
+        self._base_size = _json_size(self._message(0, {
+            "request-id": 0,
+            "error-status": 0,
+            "error-index": 0,
+            "variable-bindings": []
+        })) - 2
+        self._bulk_base_size = _json_size(self._message(0, {
+            "request-id": 0,
+            "non-repeaters": 0,
+            "max-repetitions": 0,
+            "variable-bindings": []
+        })) - 3
+        self._pb_base_size = (_pb_bytes_size(len(self.version.encode())) + _pb_int_size(65507)
+                              + _pb_bytes_size(len(b"reportableFlag"))
+                              + _pb_int_size(self.security_model))
     
     def _initialize_mib(self) -> Dict[str, any]:
-        """Initialize sample MIB objects (RFC 1213)"""
-        return {
-            "1.3.6.1.2.1.1.1.0": "System Description",
-            "1.3.6.1.2.1.1.3.0": "System Uptime",
-            "1.3.6.1.2.1.2.1.0": "Interface Number",
-            "1.3.6.1.2.1.2.2.1.2": "Interface Description"
-        }
+        """Initialize sample MIB objects (RFC 1213); copied since SET updates them"""
+        return dict(_MIB_DEFAULTS)
     
-    def get_request(self, oid: str) -> Dict:
-        """Simulate SNMP GET request (RFC 3416)"""
-        start_time = time.time()
-        
-        # Message structure based on RFC 3416
-        message = {
+    def _message(self, msg_id: int, pdu: Dict) -> Dict:
+        """Message structure based on RFC 3416"""
+        return {
             "version": self.version,
-            "msgID": np.random.randint(1, 1000),
+            "msgID": msg_id,
             "msgMaxSize": 65507,
             "msgFlags": "reportableFlag",
             "msgSecurityModel": self.security_model,
-            "pdu": {
-                "request-id": np.random.randint(1, 1000),
+            "pdu": pdu
+        }
+    
+    def _protobuf_size(self, msg_id: int, request_id: int, bindings,
+                       max_repetitions: int = 0) -> int:
+        """Protobuf-encoded message size for (name, value) variable bindings"""
+        pdu_size = _pb_int_size(request_id) + _pb_int_size(max_repetitions)
+        for name, value in bindings:
+            binding_size = (_pb_bytes_size(len(name.encode()))
+                            + _pb_bytes_size(len(str(value).encode())))
+            pdu_size += 1 + _varint_size(binding_size) + binding_size  # Repeated, always encoded
+        return self._pb_base_size + _pb_int_size(msg_id) + 1 + _varint_size(pdu_size) + pdu_size
+    
+    def _single_binding_size(self, oid: str, value: any, msg_id: int, request_id: int) -> int:
+        """Encoded size of a GET/SET message carrying one variable binding"""
+        if self.encoding == "protobuf":
+            return self._protobuf_size(msg_id, request_id, ((oid, value),))
+        return (self._base_size + len(str(msg_id)) + len(str(request_id))
+                + _VARBIND_OVERHEAD + _json_size(oid) - 2 + _json_size(value))
+    
+    def get_request(self, oid: str, build_message: bool = True,
+                    msg_id: Optional[int] = None, request_id: Optional[int] = None) -> Dict:
+        """Simulate SNMP GET request (RFC 3416); IDs are drawn when not given"""
+        start_ns = time.perf_counter_ns()
+        
+        if msg_id is None:
+            msg_id = random.randint(1, 999)
+        if request_id is None:
+            request_id = random.randint(1, 999)
+        value = self.mib_objects.get(oid, "Object not found")
+        
+        message = None
+        if build_message:
+            message = self._message(msg_id, {
+                "request-id": request_id,
                 "error-status": 0,
                 "error-index": 0,
                 "variable-bindings": [
                     {
                         "name": oid,
-                        "value": self.mib_objects.get(oid, "Object not found")
+                        "value": value
                     }
                 ]
-            }
-        }
+            })
         
-        processing_time = time.time() - start_time
-        payload_size = len(json.dumps(message).encode())
+        processing_ns = time.perf_counter_ns() - start_ns
+        payload_size = self._single_binding_size(oid, value, msg_id, request_id)
         
         return {
             "message": message,
-            "processing_time": processing_time,
+            "processing_time": processing_ns * 1e-9,
+            "processing_time_ns": processing_ns,
             "payload_size": payload_size,
             "security_overhead": 24 if self.security_model == 3 else 0  # USM overhead
         }
     
-    def set_request(self, oid: str, value: any) -> Dict:
-        """Simulate SNMP SET request (RFC 3416)"""
-        start_time = time.time()
+    def get_request_fast(self, oid: str, value: any, msg_id: int, request_id: int) -> Dict:
+        """
+        SNMP GET for an already looked-up MIB value and pre-drawn IDs
+        processing_time covers building the message, as in the baseline GET
+        """
+        start_ns = time.perf_counter_ns()
+        
+        message = self._message(msg_id, {
+            "request-id": request_id,
+            "error-status": 0,
+            "error-index": 0,
+            "variable-bindings": [
+                {
+                    "name": oid,
+                    "value": value
+                }
+            ]
+        })
         
-        message = {
-            "version": self.version,
-            "msgID": np.random.randint(1, 1000),
-            "msgMaxSize": 65507,
-            "msgFlags": "reportableFlag",
-            "msgSecurityModel": self.security_model,
-            "pdu": {
-                "request-id": np.random.randint(1, 1000),
+        processing_ns = time.perf_counter_ns() - start_ns
+        payload_size = self._single_binding_size(oid, value, msg_id, request_id)
+        
+        return {
+            "message": message,
+            "processing_time": processing_ns * 1e-9,
+            "processing_time_ns": processing_ns,
+            "payload_size": payload_size,
+            "security_overhead": 24 if self.security_model == 3 else 0
+        }
+    
+    def set_request(self, oid: str, value: any, build_message: bool = True,
+                    msg_id: Optional[int] = None, request_id: Optional[int] = None) -> Dict:
+        """Simulate SNMP SET request (RFC 3416); IDs are drawn when not given"""
+        start_ns = time.perf_counter_ns()
+        
+        if msg_id is None:
+            msg_id = random.randint(1, 999)
+        if request_id is None:
+            request_id = random.randint(1, 999)
+        
+        message = None
+        if build_message:
+            message = self._message(msg_id, {
+                "request-id": request_id,
                 "error-status": 0,
                 "error-index": 0,
                 "variable-bindings": [
@@ -134,257 +263,412 @@ class SNMPSimulator:
                         "value": value
                     }
                 ]
-            }
-        }
+            })
         
         # Simulate MIB update
         self.mib_objects[oid] = value
         
-        processing_time = time.time() - start_time
-        payload_size = len(json.dumps(message).encode())
+        processing_ns = time.perf_counter_ns() - start_ns
+        payload_size = self._single_binding_size(oid, value, msg_id, request_id)
         
         return {
             "message": message,
-            "processing_time": processing_time,
+            "processing_time": processing_ns * 1e-9,
+            "processing_time_ns": processing_ns,
             "payload_size": payload_size,
             "security_overhead": 24 if self.security_model == 3 else 0
         }
     
-    def bulk_request(self, oids: List[str]) -> Dict:
-        """Simulate SNMP GETBULK request (RFC 3416)"""
-        start_time = time.time()
-        
-        message = {
-            "version": self.version,
-            "msgID": np.random.randint(1, 1000),
-            "msgMaxSize": 65507,
-            "msgFlags": "reportableFlag",
-            "msgSecurityModel": self.security_model,
-            "pdu": {
-                "request-id": np.random.randint(1, 1000),
+    def bulk_request(self, oids: List[str], build_message: bool = True,
+                     msg_id: Optional[int] = None, request_id: Optional[int] = None) -> Dict:
+        """Simulate SNMP GETBULK request (RFC 3416); IDs are drawn when not given"""
+        start_ns = time.perf_counter_ns()
+        
+        if msg_id is None:
+            msg_id = random.randint(1, 999)
+        if request_id is None:
+            request_id = random.randint(1, 999)
+        
+        # Variable bindings as parallel name/value lists; map() keeps the lookups in C
+        values = list(map(self.mib_objects.get, oids, repeat("Object not found")))
+        
+        message = None
+        if build_message:
+            message = self._message(msg_id, {
+                "request-id": request_id,
                 "non-repeaters": 0,
                 "max-repetitions": len(oids),
                 "variable-bindings": [
                     {
                         "name": oid,
-                        "value": self.mib_objects.get(oid, "Object not found")
-                    } for oid in oids
+                        "value": value
+                    } for oid, value in zip(oids, values)
                 ]
-            }
-        }
-        
-        processing_time = time.time() - start_time
-        payload_size = len(json.dumps(message).encode())
+            })
+        
+        processing_ns = time.perf_counter_ns() - start_ns
+        if self.encoding == "protobuf":
+            payload_size = self._protobuf_size(msg_id, request_id, zip(oids, values),
+                                               max_repetitions=len(oids))
+        else:
+            # Quotes around each name are already part of the binding overhead
+            bindings_size = (_VARBIND_OVERHEAD * len(oids)
+                             + sum(map(_json_size, oids)) - 2 * len(oids)
+                             + sum(map(_json_size, values))
+                             + 2 * max(len(oids) - 1, 0))  # ", " between bindings
+            payload_size = (self._bulk_base_size + len(str(msg_id)) + len(str(request_id))
+                            + len(str(len(oids))) + bindings_size)
         
         return {
             "message": message,
-            "processing_time": processing_time,
+            "processing_time": processing_ns * 1e-9,
+            "processing_time_ns": processing_ns,
             "payload_size": payload_size,
             "security_overhead": 24 if self.security_model == 3 else 0
         }
 
+# NETCONF message templates (RFC 6241), pre-encoded so calls only substitute fields
+_CAPABILITIES = (
+    "urn:ietf:params:netconf:base:1.1",
+    "urn:ietf:params:netconf:capability:startup:1.0",
+    "urn:ietf:params:netconf:capability:candidate:1.0",
+    "urn:ietf:params:netconf:capability:validate:1.1"
+)
+_CAPABILITIES_XML = b''.join(
+    b'<capability>' + cap.encode() + b'</capability>' for cap in _CAPABILITIES
+)
+
+_MID = b"\0MID\0"  # message-id placeholder in cached requests (NUL never occurs in XML)
+_TEMPLATE_CACHE_SIZE = 128
+
+_HELLO_TMPL = b"""<?xml version="1.0" encoding="UTF-8"?>
+<hello xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+    <capabilities>
+        %b
+    </capabilities>
+    <session-id>%d</session-id>
+</hello>
+]]>]]>"""
+
+_GET_CONFIG_TMPL = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rpc message-id="%b" xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+    <get-config>
+        <source>
+            <%b/>
+        </source>
+        %b
+    </get-config>
+</rpc>
+]]>]]>"""
+
+_GET_CONFIG_REPLY_TMPL = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rpc-reply message-id="%d" xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+    <data>
+        <interface-config xmlns="urn:example:config">
+            <interface>
+                <name>eth0</name>
+                <ip-address>192.168.1.1</ip-address>
+                <netmask>255.255.255.0</netmask>
+            </interface>
+        </interface-config>
+    </data>
+</rpc-reply>
+]]>]]>"""
+
+_XPATH_FILTER_TMPL = b"<filter type='xpath' select='%b'/>"
+
+_EDIT_CONFIG_TMPL = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rpc message-id="%b" xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+    <edit-config>
+        <target>
+            <%b/>
+        </target>
+        <default-operation>%b</default-operation>
+        <config>
+            %b
+        </config>
+    </edit-config>
+</rpc>
+]]>]]>"""
+
+_OK_REPLY_TMPL = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rpc-reply message-id="%d" xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+    <ok/>
+</rpc-reply>
+]]>]]>"""
+
+_SUBSCRIPTION_TMPL = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rpc message-id="%b" xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+    <create-subscription xmlns="urn:ietf:params:xml:ns:netconf:notification:1.0">
+        <stream>%b</stream>
+    </create-subscription>
+</rpc>
+]]>]]>"""
+
+_INTERFACE_NOTIFICATION = b"""<?xml version="1.0" encoding="UTF-8"?>
+<notification xmlns="urn:ietf:params:xml:ns:netconf:notification:1.0">
+    <eventTime>2024-01-01T12:00:00Z</eventTime>
+    <interface-state-change xmlns="urn:example:events">
+        <interface>eth0</interface>
+        <state>up</state>
+    </interface-state-change>
+</notification>
+]]>]]>"""
+
 class NETCONFSimulator:
     """NETCONF Protocol Simulator based on RFC 6241, 6242"""
     
     def __init__(self):
-        self.session_id = np.random.randint(1000, 9999)
-        self.capabilities = [
-            "urn:ietf:params:netconf:base:1.1",
-            "urn:ietf:params:netconf:capability:startup:1.0",
-            "urn:ietf:params:netconf:capability:candidate:1.0",
-            "urn:ietf:params:netconf:capability:validate:1.1"
-        ]
+        self._session_id = random.randint(1000, 9998)
+        self._capabilities = _CAPABILITIES
         self.datastores = {
             "running": {},
             "candidate": {},
             "startup": {}
         }
+        self._render_hello()
+        
+        # Rendered (request, size without message-id) keyed by call arguments
+        self._get_config_cache = {}
+        self._edit_config_cache = {}
+        self._subscription_cache = {}
+    
+    @property
+    def session_id(self) -> int:
+        """NETCONF session-id announced in the hello"""
+        return self._session_id
+    
+    @session_id.setter
+    def session_id(self, value: int):
+        """Setting re-renders the cached hello"""
+        self._session_id = value
+        self._render_hello()
+    
+    @property
+    def capabilities(self) -> Tuple[str, ...]:
+        """Capability URNs announced in the hello, as a read-only tuple"""
+        return self._capabilities
+    
+    @capabilities.setter
+    def capabilities(self, value):
+        """Setting (any iterable of URNs) re-renders the cached hello"""
+        self._capabilities = tuple(value)
+        self._render_hello()
+    
+    def _render_hello(self):
+        """Pre-render the hello message; re-run whenever the session-id or capabilities change"""
+        if self._capabilities == _CAPABILITIES:
+            capabilities_xml = _CAPABILITIES_XML
+        else:
+            capabilities_xml = b''.join(
+                b'<capability>' + cap.encode() + b'</capability>' for cap in self._capabilities
+            )
+        self._hello_message = _HELLO_TMPL % (capabilities_xml, self._session_id)
     
     def hello_exchange(self) -> Dict:
         """NETCONF Hello message exchange (RFC 6241 Section 8.1)"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        hello_message = f"""<?xml version="1.0" encoding="UTF-8"?>
-<hello xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-    <capabilities>
-        {''.join(f'<capability>{cap}</capability>' for cap in self.capabilities)}
-    </capabilities>
-    <session-id>{self.session_id}</session-id>
-</hello>
-]]>]]>"""
+        hello_message = self._hello_message
         
-        processing_time = time.time() - start_time
-        payload_size = len(hello_message.encode())
+        processing_ns = time.perf_counter_ns() - start_ns
+        payload_size = len(hello_message)
         
         return {
             "message": hello_message,
-            "processing_time": processing_time,
+            "processing_time": processing_ns * 1e-9,
+            "processing_time_ns": processing_ns,
             "payload_size": payload_size,
             "session_overhead": 48  # SSH + NETCONF framing overhead
         }
     
-    def get_config(self, source: str = "running", filter_xpath: str = None) -> Dict:
-        """NETCONF get-config operation (RFC 6241 Section 7.1)"""
-        start_time = time.time()
-        
-        message_id = np.random.randint(100, 999)
-        filter_xml = f"<filter type='xpath' select='{filter_xpath}'/>" if filter_xpath else ""
-        
-        rpc_message = f"""<?xml version="1.0" encoding="UTF-8"?>
-<rpc message-id="{message_id}" xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-    <get-config>
-        <source>
-            <{source}/>
-        </source>
-        {filter_xml}
-    </get-config>
-</rpc>
-]]>]]>"""
+    def get_config(self, source: str = "running", filter_xpath: str = None,
+                   message_id: Optional[int] = None) -> Dict:
+        """NETCONF get-config operation (RFC 6241 Section 7.1); message-id is drawn when not given"""
+        start_ns = time.perf_counter_ns()
+        
+        if message_id is None:
+            message_id = random.randint(100, 998)
+        
+        cached = self._get_config_cache.get((source, filter_xpath))
+        if cached is None:
+            if len(self._get_config_cache) >= _TEMPLATE_CACHE_SIZE:
+                self._get_config_cache.clear()
+            filter_xml = _XPATH_FILTER_TMPL % filter_xpath.encode() if filter_xpath else b""
+            request_tmpl = _GET_CONFIG_TMPL % (_MID, source.encode(), filter_xml)
+            cached = (request_tmpl, len(request_tmpl) - len(_MID))
+            self._get_config_cache[(source, filter_xpath)] = cached
+        request_tmpl, base_size = cached
+        
+        mid = b"%d" % message_id
+        rpc_message = request_tmpl.replace(_MID, mid)
         
         # Simulate response
-        response = f"""<?xml version="1.0" encoding="UTF-8"?>
-<rpc-reply message-id="{message_id}" xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-    <data>
-        <interface-config xmlns="urn:example:config">
-            <interface>
-                <name>eth0</name>
-                <ip-address>192.168.1.1</ip-address>
-                <netmask>255.255.255.0</netmask>
-            </interface>
-        </interface-config>
-    </data>
-</rpc-reply>
-]]>]]>"""
+        response = _GET_CONFIG_REPLY_TMPL % message_id
         
-        processing_time = time.time() - start_time
-        payload_size = len(rpc_message.encode()) + len(response.encode())
+        processing_ns = time.perf_counter_ns() - start_ns
+        payload_size = base_size + len(mid) + len(response)
         
         return {
             "request": rpc_message,
             "response": response,
-            "processing_time": processing_time,
+            "processing_time": processing_ns * 1e-9,
+            "processing_time_ns": processing_ns,
             "payload_size": payload_size,
             "session_overhead": 48
         }
     
     def edit_config(self, target: str, config_xml: str, operation: str = "merge") -> Dict:
         """NETCONF edit-config operation (RFC 6241 Section 7.2)"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        message_id = np.random.randint(100, 999)
+        message_id = random.randint(100, 998)
         
-        rpc_message = f"""<?xml version="1.0" encoding="UTF-8"?>
-<rpc message-id="{message_id}" xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-    <edit-config>
-        <target>
-            <{target}/>
-        </target>
-        <default-operation>{operation}</default-operation>
-        <config>
-            {config_xml}
-        </config>
-    </edit-config>
-</rpc>
-]]>]]>"""
+        key = (target, config_xml, operation)
+        cached = self._edit_config_cache.get(key)
+        if cached is None:
+            if len(self._edit_config_cache) >= _TEMPLATE_CACHE_SIZE:
+                self._edit_config_cache.clear()
+            request_tmpl = _EDIT_CONFIG_TMPL % (_MID, target.encode(), operation.encode(),
+                                                config_xml.encode())
+            cached = (request_tmpl, len(request_tmpl) - len(_MID))
+            self._edit_config_cache[key] = cached
+        request_tmpl, base_size = cached
+        
+        mid = b"%d" % message_id
+        rpc_message = request_tmpl.replace(_MID, mid)
         
         # Simulate response
-        response = f"""<?xml version="1.0" encoding="UTF-8"?>
-<rpc-reply message-id="{message_id}" xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-    <ok/>
-</rpc-reply>
-]]>]]>"""
+        response = _OK_REPLY_TMPL % message_id
         
-        processing_time = time.time() - start_time
-        payload_size = len(rpc_message.encode()) + len(response.encode())
+        processing_ns = time.perf_counter_ns() - start_ns
+        payload_size = base_size + len(mid) + len(response)
         
         return {
             "request": rpc_message,
             "response": response,
-            "processing_time": processing_time,
+            "processing_time": processing_ns * 1e-9,
+            "processing_time_ns": processing_ns,
             "payload_size": payload_size,
             "session_overhead": 48
         }
     
     def notification_stream(self, stream_name: str) -> Dict:
         """NETCONF notification subscription (RFC 5277)"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        message_id = np.random.randint(100, 999)
+        message_id = random.randint(100, 998)
         
-        subscription = f"""<?xml version="1.0" encoding="UTF-8"?>
-<rpc message-id="{message_id}" xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-    <create-subscription xmlns="urn:ietf:params:xml:ns:netconf:notification:1.0">
-        <stream>{stream_name}</stream>
-    </create-subscription>
-</rpc>
-]]>]]>"""
+        cached = self._subscription_cache.get(stream_name)
+        if cached is None:
+            if len(self._subscription_cache) >= _TEMPLATE_CACHE_SIZE:
+                self._subscription_cache.clear()
+            subscription_tmpl = _SUBSCRIPTION_TMPL % (_MID, stream_name.encode())
+            cached = (subscription_tmpl,
+                      len(subscription_tmpl) + len(_INTERFACE_NOTIFICATION) - len(_MID))
+            self._subscription_cache[stream_name] = cached
+        subscription_tmpl, base_size = cached
         
-        notification = f"""<?xml version="1.0" encoding="UTF-8"?>
-<notification xmlns="urn:ietf:params:xml:ns:netconf:notification:1.0">
-    <eventTime>2024-01-01T12:00:00Z</eventTime>
-    <interface-state-change xmlns="urn:example:events">
-        <interface>eth0</interface>
-        <state>up</state>
-    </interface-state-change>
-</notification>
-]]>]]>"""
+        mid = b"%d" % message_id
+        subscription = subscription_tmpl.replace(_MID, mid)
+        notification = _INTERFACE_NOTIFICATION
         
-        processing_time = time.time() - start_time
-        payload_size = len(subscription.encode()) + len(notification.encode())
+        processing_ns = time.perf_counter_ns() - start_ns
+        payload_size = base_size + len(mid)
         
         return {
             "subscription": subscription,
             "notification": notification,
-            "processing_time": processing_time,
+            "processing_time": processing_ns * 1e-9,
+            "processing_time_ns": processing_ns,
             "payload_size": payload_size,
             "session_overhead": 48
         }
 
+@dataclass(slots=True)
+class PerfStats:
+    """Benchmark statistics for one protocol (times in seconds, sizes in bytes)"""
+    avg_time: float
+    std_time: float
+    avg_size: float
+    std_size: float
+    
+    @classmethod
+    def from_samples(cls, times_ns: np.ndarray, sizes: np.ndarray) -> "PerfStats":
+        """Mean and sample standard deviation of per-call times and payload sizes"""
+        many = len(times_ns) > 1
+        return cls(
+            avg_time=float(times_ns.mean()) * 1e-9,
+            std_time=float(times_ns.std(ddof=1)) * 1e-9 if many else 0.0,
+            avg_size=float(sizes.mean()),
+            std_size=float(sizes.std(ddof=1)) if many else 0.0
+        )
+
+def _benchmark_iterations(snmp: SNMPSimulator, netconf: NETCONFSimulator,
+                          snmp_ids: List[Tuple[int, int]], netconf_ids: List[int]) -> np.ndarray:
+    """
+    Run SNMP GET / NETCONF get-config benchmark iterations for pre-drawn IDs
+    Returns one row per iteration: (snmp_time_ns, snmp_size, netconf_time_ns, netconf_size)
+    Module level so worker processes can run it
+    """
+    # Times are kept as integer nanoseconds and converted only in the report
+    samples = np.empty((len(netconf_ids), 4), dtype=np.int64)
+    
+    # The polled object is the same every iteration, so look it up once
+    oid = "1.3.6.1.2.1.1.1.0"
+    mib_value = snmp.mib_objects.get(oid, "Object not found")
+    
+    # Test GET operations
+    for i in range(len(netconf_ids)):
+        # SNMP GET
+        msg_id, request_id = snmp_ids[i]
+        snmp_result = snmp.get_request_fast(oid, mib_value, msg_id, request_id)
+        samples[i, 0] = snmp_result["processing_time_ns"]
+        samples[i, 1] = snmp_result["payload_size"]
+        
+        # NETCONF get-config
+        netconf_result = netconf.get_config("running", message_id=netconf_ids[i])
+        samples[i, 2] = netconf_result["processing_time_ns"]
+        samples[i, 3] = netconf_result["payload_size"]
+    
+    return samples
+
 class ComparativeAnalyzer:
     """Comparative analysis engine for SNMP vs NETCONF"""
     
     def __init__(self):
         self.snmp = SNMPSimulator()
         self.netconf = NETCONFSimulator()
-        self.results = {
-            "performance": {},
-            "security": {},
-            "complexity": {},
-            "scalability": {}
-        }
     
-    def performance_benchmark(self, iterations: int = 100) -> Dict:
-        """Performance comparison across multiple operations"""
-        snmp_times = []
-        netconf_times = []
-        snmp_sizes = []
-        netconf_sizes = []
-        
-        # Test GET operations
-        for _ in range(iterations):
-            # SNMP GET
-            snmp_result = self.snmp.get_request("1.3.6.1.2.1.1.1.0")
-            snmp_times.append(snmp_result["processing_time"])
-            snmp_sizes.append(snmp_result["payload_size"])
-            
-            # NETCONF get-config
-            netconf_result = self.netconf.get_config("running")
-            netconf_times.append(netconf_result["processing_time"])
-            netconf_sizes.append(netconf_result["payload_size"])
+    def performance_benchmark(self, iterations: int = 100, workers: int = 1) -> Dict:
+        """
+        Performance comparison across multiple operations
+        Both protocols are timed on building their GET messages (SNMP request,
+        NETCONF get-config request and reply); payload sizing is not timed
+        With workers > 1 the iterations are split across that many processes
+        """
+        # Draw all message/request IDs up front rather than once per call, from the
+        # same random module the simulators use, so random.seed() reproduces a run
+        snmp_ids = list(zip(random.choices(range(1, 1000), k=iterations),
+                            random.choices(range(1, 1000), k=iterations)))
+        netconf_ids = random.choices(range(100, 999), k=iterations)
+        
+        if workers > 1 and iterations > 1:
+            chunk = -(-iterations // workers)
+            bounds = range(0, iterations, chunk)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                samples = np.concatenate(list(executor.map(
+                    _benchmark_iterations, repeat(self.snmp), repeat(self.netconf),
+                    [snmp_ids[b:b + chunk] for b in bounds],
+                    [netconf_ids[b:b + chunk] for b in bounds]
+                )))
+        else:
+            samples = _benchmark_iterations(self.snmp, self.netconf, snmp_ids, netconf_ids)
+        snmp_times, snmp_sizes, netconf_times, netconf_sizes = samples.T
         
         return {
-            "snmp": {
-                "avg_time": statistics.mean(snmp_times),
-                "std_time": statistics.stdev(snmp_times) if len(snmp_times) > 1 else 0,
-                "avg_size": statistics.mean(snmp_sizes),
-                "std_size": statistics.stdev(snmp_sizes) if len(snmp_sizes) > 1 else 0
-            },
-            "netconf": {
-                "avg_time": statistics.mean(netconf_times),
-                "std_time": statistics.stdev(netconf_times) if len(netconf_times) > 1 else 0,
-                "avg_size": statistics.mean(netconf_sizes),
-                "std_size": statistics.stdev(netconf_sizes) if len(netconf_sizes) > 1 else 0
-            }
+            "snmp": PerfStats.from_samples(snmp_times, snmp_sizes),
+            "netconf": PerfStats.from_samples(netconf_times, netconf_sizes)
         }
     
     def security_analysis(self) -> Dict:
@@ -447,32 +731,42 @@ class ComparativeAnalyzer:
             "netconf": {"score": netconf_complexity, "encoding": "XML"}
         }
     
+    def encoding_analysis(self) -> Dict:
+        """SNMP payload size under JSON and Protobuf encodings"""
+        oids = list(self.snmp.mib_objects)
+        sizes = {}
+        for encoding in ("json", "protobuf"):
+            snmp = SNMPSimulator(encoding=encoding)
+            sizes[encoding] = {
+                "get": snmp.get_request(oids[0], build_message=False,
+                                        msg_id=500, request_id=500)["payload_size"],
+                "bulk": snmp.bulk_request(oids, build_message=False,
+                                          msg_id=500, request_id=500)["payload_size"]
+            }
+        return sizes
+    
     def scalability_test(self, device_counts: List[int]) -> Dict:
         """Scalability analysis with varying device counts"""
-        snmp_latencies = []
-        netconf_latencies = []
-        
-        for device_count in device_counts:
-            # Simulate SNMP scalability
-            snmp_latency = ProtocolMetrics.latency_model(
-                message_size=200 * device_count,  # Multiple OID requests
-                network_delay=0.001 * device_count,  # Network congestion
-                processing_time=0.0001 * device_count  # Processing overhead
-            )
-            snmp_latencies.append(snmp_latency)
-            
-            # Simulate NETCONF scalability
-            netconf_latency = ProtocolMetrics.latency_model(
-                message_size=800 * device_count,  # XML overhead
-                network_delay=0.001 * device_count,  # Network congestion
-                processing_time=0.0005 * device_count  # XML parsing overhead
-            )
-            netconf_latencies.append(netconf_latency)
+        dc = np.asarray(device_counts, dtype=np.float64)
+        
+        # Simulate SNMP scalability
+        snmp_latencies = ProtocolMetrics.latency_model(
+            message_size=200 * dc,  # Multiple OID requests
+            network_delay=0.001 * dc,  # Network congestion
+            processing_time=0.0001 * dc  # Processing overhead
+        )
+        
+        # Simulate NETCONF scalability
+        netconf_latencies = ProtocolMetrics.latency_model(
+            message_size=800 * dc,  # XML overhead
+            network_delay=0.001 * dc,  # Network congestion
+            processing_time=0.0005 * dc  # XML parsing overhead
+        )
         
         return {
             "device_counts": device_counts,
-            "snmp_latencies": snmp_latencies,
-            "netconf_latencies": netconf_latencies
+            "snmp_latencies": snmp_latencies.tolist(),
+            "netconf_latencies": netconf_latencies.tolist()
         }
     
     def generate_comprehensive_report(self) -> Dict:
@@ -495,11 +789,16 @@ class ComparativeAnalyzer:
         print("4. Scalability Test...")
         scalability = self.scalability_test([10, 50, 100, 500, 1000])
         
+        # Encoding analysis
+        print("5. Encoding Analysis...")
+        encoding = self.encoding_analysis()
+        
         return {
             "performance": performance,
             "security": security,
             "complexity": complexity,
             "scalability": scalability,
+            "encoding": encoding,
             "summary": {
                 "snmp_advantages": [
                     "Lower protocol overhead",
@@ -531,8 +830,8 @@ def main():
     print("="*60)
     
     print(f"\nPerformance Metrics:")
-    print(f"SNMP - Avg Time: {results['performance']['snmp']['avg_time']:.6f}s, Avg Size: {results['performance']['snmp']['avg_size']} bytes")
-    print(f"NETCONF - Avg Time: {results['performance']['netconf']['avg_time']:.6f}s, Avg Size: {results['performance']['netconf']['avg_size']} bytes")
+    print(f"SNMP - Avg Time: {results['performance']['snmp'].avg_time:.6f}s, Avg Size: {results['performance']['snmp'].avg_size} bytes")
+    print(f"NETCONF - Avg Time: {results['performance']['netconf'].avg_time:.6f}s, Avg Size: {results['performance']['netconf'].avg_size} bytes")
     
     print(f"\nSecurity Scores:")
     print(f"SNMP Security Score: {results['security']['snmp']['score']:.2f}/1.0")
@@ -542,6 +841,10 @@ def main():
     print(f"SNMP Complexity: {results['complexity']['snmp']['score']:.2f}")
     print(f"NETCONF Complexity: {results['complexity']['netconf']['score']:.2f}")
     
+    print(f"\nSNMP Encoding Sizes (JSON vs Protobuf):")
+    print(f"GET: {results['encoding']['json']['get']} vs {results['encoding']['protobuf']['get']} bytes")
+    print(f"GETBULK: {results['encoding']['json']['bulk']} vs {results['encoding']['protobuf']['bulk']} bytes")
+    
     print(f"\nRecommendations:")
     print(f"Use SNMP for: {results['summary']['recommendations']['use_snmp']}")
     print(f"Use NETCONF for: {results['summary']['recommendations']['use_netconf']}")